@@ -1,12 +1,87 @@
 """
 Table-related operations for Word Document Server.
 """
+import copy
+import functools
+import io
+import logging
+
 from docx.oxml.shared import OxmlElement, qn
-from docx.oxml.ns import nsdecls
+from docx.oxml.ns import nsdecls, nsmap
 from docx.oxml import parse_xml
 from docx.shared import RGBColor, Inches, Cm, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_CELL_VERTICAL_ALIGNMENT
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.table import Table
+
+
+_log = logging.getLogger(__name__)
+
+# Namespace declaration for w:-prefixed XML snippets
+_NSDECL_W = nsdecls('w')
+
+# Clark-notation names used in per-cell loops, resolved once at import
+_QN_VAL = qn('w:val')
+_QN_SZ = qn('w:sz')
+_QN_SPACE = qn('w:space')
+_QN_COLOR = qn('w:color')
+_QN_FILL = qn('w:fill')
+_QN_SHD = qn('w:shd')
+_QN_TCBORDERS = qn('w:tcBorders')
+_QN_TR = qn('w:tr')
+_QN_TC = qn('w:tc')
+
+# Attributes holding relationship ids: anything in the r: namespace, plus VML's o:relid
+_R_NS_PREFIX = '{%s}' % nsmap['r']
+_QN_O_RELID = '{urn:schemas-microsoft-com:office:office}relid'
+
+# Elements referring by w:id to notes and comments held in other parts of the source package
+_PART_REFERENCE_XPATH = (
+    './/w:footnoteReference | .//w:endnoteReference | .//w:commentReference'
+    ' | .//w:commentRangeStart | .//w:commentRangeEnd'
+)
+
+# w:tcBorders children that override w:tblBorders; w:tl2br/w:tr2bl diagonals do not
+_QN_TCBORDERS_EDGES = frozenset(
+    qn(f'w:{side}') for side in
+    ('top', 'left', 'bottom', 'right', 'start', 'end', 'insideH', 'insideV')
+)
+
+# Characters allowed in a normalized hex color
+_HEX_DIGITS = frozenset('0123456789ABCDEF')
+
+# w:tcPr children that must follow w:shd, in schema order
+_TCPR_SHD_SUCCESSORS = (
+    'w:noWrap', 'w:tcMar', 'w:textDirection', 'w:tcFitText', 'w:vAlign',
+    'w:hideMark', 'w:headers', 'w:cellIns', 'w:cellDel', 'w:cellMerge', 'w:tcPrChange'
+)
+
+# Separates the base style name from the colors in generated header table styles
+_HEADER_STYLE_MARKER = ' - Header '
+
+# border_style values accepted by apply_table_style, mapped to w:val
+_BORDER_VAL_MAP = {
+    'none': 'nil',
+    'single': 'single',
+    'double': 'double',
+    'thick': 'thick'
+}
+
+# Named text colors accepted by format_cell_text
+_COLOR_MAP = {
+    'red': RGBColor(255, 0, 0),
+    'blue': RGBColor(0, 0, 255),
+    'green': RGBColor(0, 128, 0),
+    'yellow': RGBColor(255, 255, 0),
+    'black': RGBColor(0, 0, 0),
+    'gray': RGBColor(128, 128, 128),
+    'grey': RGBColor(128, 128, 128),
+    'white': RGBColor(255, 255, 255),
+    'purple': RGBColor(128, 0, 128),
+    'orange': RGBColor(255, 165, 0)
+}
 
 
 def set_cell_border(cell, **kwargs):
@@ -20,25 +95,84 @@ def set_cell_border(cell, **kwargs):
     tc = cell._tc
     tcPr = tc.get_or_add_tcPr()
     
+    # Border attributes are shared by every side
+    val = kwargs.get('val', 'single')
+    sz = kwargs.get('sz', '4')
+    space = kwargs.get('space', '0')
+    color = kwargs.get('color', 'auto')
+    
+    tcBorders = None
+    
     # Create border elements
     for key, value in kwargs.items():
         if key in ['top', 'left', 'bottom', 'right']:
             tag = 'w:{}'.format(key)
             
             element = OxmlElement(tag)
-            element.set(qn('w:val'), kwargs.get('val', 'single'))
-            element.set(qn('w:sz'), kwargs.get('sz', '4'))
-            element.set(qn('w:space'), kwargs.get('space', '0'))
-            element.set(qn('w:color'), kwargs.get('color', 'auto'))
+            element.set(_QN_VAL, val)
+            element.set(_QN_SZ, sz)
+            element.set(_QN_SPACE, space)
+            element.set(_QN_COLOR, color)
             
-            tcBorders = tcPr.first_child_found_in("w:tcBorders")
             if tcBorders is None:
-                tcBorders = OxmlElement('w:tcBorders')
-                tcPr.append(tcBorders)
+                tcBorders = tcPr.find(_QN_TCBORDERS)
+                if tcBorders is None:
+                    tcBorders = OxmlElement('w:tcBorders')
+                    tcPr.append(tcBorders)
                 
             tcBorders.append(element)
 
 
+def set_table_borders(table, val='single', sz='4', space='0', color='auto'):
+    """
+    Set uniform borders for a whole table.
+    
+    Writes a single w:tblBorders (outer edges plus inside horizontal and
+    vertical lines) to the table properties, and removes the per-cell edge
+    borders that would override it. Diagonal cell borders are kept.
+    
+    Args:
+        table: The table to modify
+        val: Border type ('single', 'double', 'thick', 'nil', ...)
+        sz: Border width in eighths of a point
+        space: Border spacing in points
+        color: Border color (hex string or 'auto')
+    """
+    tbl = table._tbl
+    
+    # Get or create table properties
+    tbl_pr = tbl.find(qn('w:tblPr'))
+    if tbl_pr is None:
+        tbl_pr = OxmlElement('w:tblPr')
+        tbl.insert(0, tbl_pr)
+    
+    # Remove existing table borders
+    existing_borders = tbl_pr.find(qn('w:tblBorders'))
+    if existing_borders is not None:
+        tbl_pr.remove(existing_borders)
+    
+    borders = OxmlElement('w:tblBorders')
+    for side in ('top', 'left', 'bottom', 'right', 'insideH', 'insideV'):
+        element = OxmlElement(f'w:{side}')
+        element.set(_QN_VAL, val)
+        element.set(_QN_SZ, sz)
+        element.set(_QN_SPACE, space)
+        element.set(_QN_COLOR, color)
+        borders.append(element)
+    tbl_pr.insert_element_before(
+        borders, 'w:shd', 'w:tblLayout', 'w:tblCellMar', 'w:tblLook',
+        'w:tblCaption', 'w:tblDescription'
+    )
+    
+    # Cell-level borders take precedence over table-level ones
+    for tc_borders in tbl.xpath('./w:tr/w:tc/w:tcPr/w:tcBorders'):
+        for child in list(tc_borders):
+            if child.tag in _QN_TCBORDERS_EDGES:
+                tc_borders.remove(child)
+        if len(tc_borders) == 0:
+            tc_borders.getparent().remove(tc_borders)
+
+
 def apply_table_style(table, has_header_row=False, border_style=None, shading=None):
     """
     Apply formatting to a table.
@@ -47,69 +181,50 @@ def apply_table_style(table, has_header_row=False, border_style=None, shading=No
         table: The table to format
         has_header_row: If True, formats the first row as a header
         border_style: Style for borders ('none', 'single', 'double', 'thick')
-        shading: 2D list of cell background colors (by row and column)
+        shading: 2D list of cell background colors (by row and column);
+            cells with an invalid color are left unchanged
         
     Returns:
-        True if successful, False otherwise
+        True once the formatting has been applied
     """
-    try:
-        # Format header row if requested
-        if has_header_row and table.rows:
-            header_row = table.rows[0]
-            for cell in header_row.cells:
-                for paragraph in cell.paragraphs:
-                    if paragraph.runs:
-                        for run in paragraph.runs:
-                            run.bold = True
-        
-        # Apply border style if specified
-        if border_style:
-            val_map = {
-                'none': 'nil',
-                'single': 'single',
-                'double': 'double',
-                'thick': 'thick'
-            }
-            val = val_map.get(border_style.lower(), 'single')
-            
-            # Apply to all cells
-            for row in table.rows:
-                for cell in row.cells:
-                    set_cell_border(
-                        cell,
-                        top=True,
-                        bottom=True,
-                        left=True,
-                        right=True,
-                        val=val,
-                        color="000000"
-                    )
-        
-        # Apply cell shading if specified
-        if shading:
-            for i, row_colors in enumerate(shading):
-                if i >= len(table.rows):
-                    break
-                for j, color in enumerate(row_colors):
-                    if j >= len(table.rows[i].cells):
-                        break
-                    try:
-                        # Apply shading to cell
-                        cell = table.rows[i].cells[j]
-                        shading_elm = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}"/>')
-                        cell._tc.get_or_add_tcPr().append(shading_elm)
-                    except:
-                        # Skip if color format is invalid
-                        pass
+    rows = list(table.rows)
+    
+    # Format header row if requested
+    if has_header_row and rows:
+        header_row = rows[0]
+        for cell in header_row.cells:
+            for paragraph in cell.paragraphs:
+                if paragraph.runs:
+                    for run in paragraph.runs:
+                        run.bold = True
+    
+    # Apply border style if specified
+    if border_style:
+        val = _BORDER_VAL_MAP.get(border_style.lower(), 'single')
         
-        return True
-    except Exception:
-        return False
+        # One table-level w:tblBorders covers every cell
+        set_table_borders(table, val=val, color="000000")
+    
+    # Apply cell shading if specified
+    if shading:
+        # Validate the whole grid up front; invalid colors leave their cell unchanged
+        shd_rows = []
+        for row_colors in shading[:len(rows)]:
+            shd_row = []
+            for color in row_colors:
+                fill_hex = _validate_hex_color(color)
+                shd_row.append(_get_shd_prototype(fill_hex) if fill_hex else None)
+            shd_rows.append(shd_row)
+        
+        # Clone one prototype w:shd per distinct color into each cell
+        _bulk_shade_cells(table._tbl, shd_rows)
+    
+    return True
 
 
-def copy_table(source_table, target_doc):
+def _copy_table_text(source_table, target_doc):
     """
-    Copy a table from one document to another.
+    Copy a table by recreating it in the target document with text only.
     
     Args:
         source_table: The table to copy
@@ -121,10 +236,10 @@ def copy_table(source_table, target_doc):
     # Create a new table with the same dimensions
     new_table = target_doc.add_table(rows=len(source_table.rows), cols=len(source_table.columns))
     
-    # Try to apply the same style
+    # Try to apply the same style, looked up by name in the target's styles
     try:
         if source_table.style:
-            new_table.style = source_table.style
+            new_table.style = source_table.style.name
     except:
         # Fall back to default grid style
         try:
@@ -132,16 +247,294 @@ def copy_table(source_table, target_doc):
         except:
             pass
     
-    # Copy cell contents
-    for i, row in enumerate(source_table.rows):
-        for j, cell in enumerate(row.cells):
-            for paragraph in cell.paragraphs:
-                if paragraph.text:
-                    new_table.cell(i, j).text = paragraph.text
+    # Copy cell contents straight from the source w:tr/w:tc elements
+    new_rows = list(new_table.rows)
+    for i, tr in enumerate(source_table._tbl.iterchildren(qn('w:tr'))):
+        new_cells = list(new_rows[i].cells)
+        for j, tc in enumerate(tr.iterchildren(qn('w:tc'))):
+            if j >= len(new_cells):
+                break
+            for p in tc.iterchildren(qn('w:p')):
+                if p.text:
+                    new_cells[j].text = p.text
     
     return new_table
 
 
+def _relationship_attributes(element):
+    """
+    Find the attributes of an element tree that refer to package relationships.
+    
+    Args:
+        element: The root element to search
+        
+    Returns:
+        List of (element, attribute name, relationship id) tuples
+    """
+    found = []
+    for el in element.iter():
+        for attr, value in el.attrib.items():
+            if attr.startswith(_R_NS_PREFIX) or attr == _QN_O_RELID:
+                found.append((el, attr, value))
+    return found
+
+
+def _remap_relationships(new_tbl, source_part, target_part):
+    """
+    Re-create the relationships used by a cloned table in the target part.
+    
+    External relationships (hyperlinks) and images are carried over and the
+    ids in the clone are rewritten to the target's ids. Nothing is changed
+    if any other kind of relationship is referenced.
+    
+    Args:
+        new_tbl: The cloned w:tbl element, not yet inserted in the target
+        source_part: The part the table was cloned from
+        target_part: The part the table is being copied to
+        
+    Returns:
+        True if every relationship was carried over, False otherwise
+    """
+    references = _relationship_attributes(new_tbl)
+    
+    # Check everything first so an unsupported reference leaves the target untouched
+    for el, attr, r_id in references:
+        if attr == _QN_O_RELID:
+            return False
+        rel = source_part.rels.get(r_id)
+        if rel is None:
+            return False
+        if not rel.is_external and rel.reltype != RT.IMAGE:
+            return False
+    
+    new_ids = {}
+    for el, attr, r_id in references:
+        if r_id not in new_ids:
+            rel = source_part.rels[r_id]
+            if rel.is_external:
+                new_ids[r_id] = target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+            else:
+                new_ids[r_id], _ = target_part.get_or_add_image(io.BytesIO(rel.target_part.blob))
+        el.set(attr, new_ids[r_id])
+    return True
+
+
+def _remap_table_style(new_tbl, source_part, target_doc):
+    """
+    Point a cloned table's w:tblStyle at a style that exists in the target document.
+    
+    The style id is kept if the target defines it, otherwise it is mapped to
+    the target style with the same name, or removed if there is none.
+    
+    Args:
+        new_tbl: The cloned w:tbl element
+        source_part: The part the table was cloned from
+        target_doc: The document the table is being copied to
+    """
+    tbl_style = new_tbl.tblPr.find(qn('w:tblStyle'))
+    if tbl_style is None:
+        return
+    
+    style_id = tbl_style.get(_QN_VAL)
+    target_styles = target_doc.styles.element
+    if target_styles.get_by_id(style_id) is not None:
+        return
+    
+    source_style = source_part.styles.element.get_by_id(style_id)
+    if source_style is not None:
+        target_style = target_styles.get_by_name(source_style.name_val)
+        if target_style is not None:
+            tbl_style.set(_QN_VAL, target_style.styleId)
+            return
+    
+    tbl_style.getparent().remove(tbl_style)
+
+
+def copy_table(source_table, target_doc):
+    """
+    Copy a table from one document to another.
+    
+    The underlying w:tbl element is cloned as a whole, so cell formatting,
+    shading and borders are carried over along with the text. Hyperlinks and
+    images are re-created in the target document and list numbering is
+    dropped; tables referencing any other related part, footnotes, endnotes
+    or comments are copied as text only.
+    
+    Args:
+        source_table: The table to copy
+        target_doc: The document to copy the table to
+        
+    Returns:
+        The new table in the target document
+    """
+    source_part = source_table.part
+    target_part = target_doc.part
+    new_tbl = copy.deepcopy(source_table._tbl)
+    
+    if source_part is not target_part:
+        if new_tbl.xpath(_PART_REFERENCE_XPATH):
+            return _copy_table_text(source_table, target_doc)
+        if not _remap_relationships(new_tbl, source_part, target_part):
+            return _copy_table_text(source_table, target_doc)
+        _remap_table_style(new_tbl, source_part, target_doc)
+        
+        # numIds refer to the source's numbering definitions
+        for num_pr in new_tbl.xpath('.//w:pPr/w:numPr'):
+            num_pr.getparent().remove(num_pr)
+    
+    # Insert ahead of the body's trailing w:sectPr, as add_table() does
+    target_doc.element.body._insert_tbl(new_tbl)
+    return Table(new_tbl, target_doc._body)
+
+
+def _validate_hex_color(color):
+    """
+    Validate and normalize a hex color string like "#ff0000" to "FF0000".
+    
+    Args:
+        color: Hex color string, with or without a leading '#'; any other
+            value is treated as invalid
+        
+    Returns:
+        The upper-cased 6-digit hex string, or None if the color is invalid
+    """
+    if not isinstance(color, str):
+        return None
+    return _normalize_hex_color(color)
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_hex_color(hex_color):
+    """
+    Normalize a hex color string like "#ff0000" to "FF0000".
+    
+    Args:
+        hex_color: Hex color string, with or without a leading '#'
+        
+    Returns:
+        The upper-cased 6-digit hex string, or None if it is not 6 hex digits
+    """
+    hex_color = hex_color.lstrip('#').upper()
+    if len(hex_color) == 6 and _HEX_DIGITS.issuperset(hex_color):  # Valid hex color
+        return hex_color
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgbcolor(hex_color):
+    """
+    Convert a hex color string like "FF0000" or "#FF0000" to an RGBColor.
+    
+    Args:
+        hex_color: Hex color string, with or without a leading '#'
+        
+    Returns:
+        The matching RGBColor; raises ValueError if the string is not valid hex
+    """
+    hex_color = hex_color.lstrip('#')
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    return RGBColor(r, g, b)
+
+
+def _replace_shd(tc_pr, shd):
+    """
+    Replace the shading element of a w:tcPr with a prepared w:shd element.
+    
+    Each cell needs its own element; appending moves it out of any previous parent.
+    
+    Args:
+        tc_pr: The cell properties element to modify
+        shd: The w:shd element to insert
+    """
+    existing_shd = tc_pr.find(_QN_SHD)
+    if existing_shd is not None:
+        tc_pr.replace(existing_shd, shd)
+    else:
+        # Keep w:shd in its schema position rather than at the end of w:tcPr
+        tc_pr.insert_element_before(shd, *_TCPR_SHD_SUCCESSORS)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_shd_prototype(fill_color=None):
+    """
+    Get a parsed clear-pattern w:shd element for a fill color.
+    
+    The element is shared between calls and must not be inserted into a
+    document directly; callers insert deep copies of it.
+    
+    Args:
+        fill_color: Fill color written to w:fill, or None for no fill
+        
+    Returns:
+        The prototype w:shd element
+    """
+    fill_attr = f' w:fill="{fill_color}"' if fill_color else ''
+    return parse_xml(f'<w:shd {_NSDECL_W} w:val="clear" w:color="auto"{fill_attr}/>')
+
+
+def _bulk_shade_cells(tbl, shd_rows):
+    """
+    Shade many table cells working directly on the w:tbl element.
+    
+    Walks w:tr/w:tc children without building row or cell proxies. Each cell
+    gets its own copy of the prototype w:shd chosen for it. Cells line up as
+    they do with row.cells: a cell spanning several grid columns covers each
+    of them, and a vertically merged continuation cell stands for the w:tc
+    at the top of the merge, which is the one shaded.
+    
+    Args:
+        tbl: The w:tbl element
+        shd_rows: One entry per row, in order. An entry is either a single
+            prototype w:shd for every cell of the row, or a list of prototypes
+            by grid column, where None leaves the cell unchanged. A cell
+            spanning several grid columns takes the last prototype among them.
+    """
+    shd_targets = []
+    # Grid column -> w:tc at the top of the vertical merge covering it in the previous row
+    merge_tops = {}
+    for tr, shd_row in zip(tbl.iterchildren(_QN_TR), shd_rows):
+        grid_col = 0
+        row_tops = {}
+        for tc in tr.iterchildren(_QN_TC):
+            span = tc.grid_span
+            if tc.vMerge == 'continue':
+                tc = merge_tops.get(grid_col, tc)
+            row_tops[grid_col] = tc
+            if isinstance(shd_row, list):
+                shd = None
+                for candidate in shd_row[grid_col:grid_col + span]:
+                    if candidate is not None:
+                        shd = candidate
+            else:
+                shd = shd_row
+            grid_col += span
+            if shd is not None:
+                shd_targets.append((tc.get_or_add_tcPr(), copy.deepcopy(shd)))
+        merge_tops = row_tops
+    
+    for tc_pr, shd in shd_targets:
+        _replace_shd(tc_pr, shd)
+
+
+def _set_shading_on_tcpr(tc_pr, fill_hex=None, pattern="clear", pattern_color="auto"):
+    """
+    Replace the shading element of an existing w:tcPr.
+    
+    Args:
+        tc_pr: The cell properties element to modify
+        fill_hex: Normalized 6-digit hex fill color, or None for no fill
+        pattern: Shading pattern ("clear", "solid", "pct10", "pct20", etc.)
+        pattern_color: Pattern color for patterned fills
+    """
+    # Build shading element with its attributes in one call, without the XML parser
+    attrs = {_QN_VAL: pattern, _QN_COLOR: pattern_color}
+    if fill_hex:
+        attrs[_QN_FILL] = fill_hex
+    _replace_shd(tc_pr, tc_pr.makeelement(_QN_SHD, attrs))
+
+
 def set_cell_shading(cell, fill_color=None, pattern="clear", pattern_color="auto"):
     """
     Apply shading/filling to a table cell.
@@ -156,44 +549,22 @@ def set_cell_shading(cell, fill_color=None, pattern="clear", pattern_color="auto
         True if successful, False otherwise
     """
     try:
-        # Get or create table cell properties
-        tc_pr = cell._tc.get_or_add_tcPr()
-        
-        # Remove existing shading
-        existing_shd = tc_pr.find(qn('w:shd'))
-        if existing_shd is not None:
-            tc_pr.remove(existing_shd)
-        
-        # Create shading element
-        shd_attrs = {
-            'w:val': pattern,
-            'w:color': pattern_color if pattern_color != "auto" else "auto"
-        }
-        
-        # Set fill color
+        # Resolve fill color
+        fill_hex = None
         if fill_color:
             if isinstance(fill_color, str):
-                # Hex color string - remove # if present
-                fill_color = fill_color.lstrip('#').upper()
-                if len(fill_color) == 6:  # Valid hex color
-                    shd_attrs['w:fill'] = fill_color
+                # Hex color string
+                fill_hex = _normalize_hex_color(fill_color)
             elif isinstance(fill_color, RGBColor):
                 # RGBColor object
-                hex_color = f"{fill_color.r:02X}{fill_color.g:02X}{fill_color.b:02X}"
-                shd_attrs['w:fill'] = hex_color
-        
-        # Build XML string
-        attr_str = ' '.join([f'{k}="{v}"' for k, v in shd_attrs.items()])
-        shd_xml = f'<w:shd {nsdecls("w")} {attr_str}/>'
+                fill_hex = f"{fill_color[0]:02X}{fill_color[1]:02X}{fill_color[2]:02X}"
         
-        # Parse and append shading element
-        shading_elm = parse_xml(shd_xml)
-        tc_pr.append(shading_elm)
+        _set_shading_on_tcpr(cell._tc.get_or_add_tcPr(), fill_hex, pattern, pattern_color)
         
         return True
         
-    except Exception as e:
-        print(f"Error setting cell shading: {e}")
+    except Exception:
+        _log.debug("Error setting cell shading", exc_info=True)
         return False
 
 
@@ -207,23 +578,124 @@ def apply_alternating_row_shading(table, color1="FFFFFF", color2="F2F2F2"):
         color2: Color for even rows (hex string)
         
     Returns:
-        True if successful, False otherwise
+        True once the shading has been applied
+    """
+    # Clone the two prototype w:shd elements into each cell;
+    # an invalid color clears the fill of its rows
+    shd1 = _get_shd_prototype(_validate_hex_color(color1))
+    shd2 = _get_shd_prototype(_validate_hex_color(color2))
+    
+    num_rows = len(table._tbl.tr_lst)
+    _bulk_shade_cells(table._tbl, [shd1 if i % 2 == 0 else shd2 for i in range(num_rows)])
+    return True
+
+
+def _get_or_add_header_table_style(table, fill_hex, text_hex):
+    """
+    Get the table style that highlights the first row of a table, creating it if needed.
+    
+    The style is based on the table's current style and adds a firstRow
+    conditional format with the header shading, bold text and text color.
+    Styles are named after their base style and colors, so later calls with
+    the same combination reuse the existing definition.
+    
+    Args:
+        table: The table the style is for
+        fill_hex: Normalized header background color, or None
+        text_hex: Normalized header text color, or None to leave it unchanged
+        
+    Returns:
+        The table style
     """
+    styles = table.part.styles
+    base_style = table.style
+    # Re-highlighting a table builds on the original style, not on a previous header style
+    if base_style is not None and _HEADER_STYLE_MARKER in base_style.name:
+        base_style = base_style.base_style
+    
+    base_name = base_style.name if base_style is not None else 'Table'
+    style_name = f"{base_name}{_HEADER_STYLE_MARKER}{fill_hex or 'None'}-{text_hex or 'Auto'}"
     try:
-        for i, row in enumerate(table.rows):
-            fill_color = color1 if i % 2 == 0 else color2
-            for cell in row.cells:
-                set_cell_shading(cell, fill_color=fill_color)
-        return True
-    except Exception as e:
-        print(f"Error applying alternating row shading: {e}")
-        return False
+        return styles[style_name]
+    except KeyError:
+        pass
+    
+    style = styles.add_style(style_name, WD_STYLE_TYPE.TABLE)
+    style.base_style = base_style
+    
+    first_row = OxmlElement('w:tblStylePr')
+    first_row.set(qn('w:type'), 'firstRow')
+    
+    r_pr = OxmlElement('w:rPr')
+    r_pr.append(OxmlElement('w:b'))
+    if text_hex:
+        text_color_elm = OxmlElement('w:color')
+        text_color_elm.set(_QN_VAL, text_hex)
+        r_pr.append(text_color_elm)
+    first_row.append(r_pr)
+    
+    tc_pr = OxmlElement('w:tcPr')
+    _set_shading_on_tcpr(tc_pr, fill_hex)
+    first_row.append(tc_pr)
+    
+    style.element.append(first_row)
+    return style
+
+
+def _apply_header_table_style(table, header_row, fill_hex, text_hex):
+    """
+    Highlight the first row of a table through conditional table-style formatting.
+    
+    Args:
+        table: The table to format
+        header_row: The table's first row
+        fill_hex: Normalized header background color, or None
+        text_hex: Normalized header text color, or None to leave it unchanged
+    """
+    # Do everything that can fail before touching the table, so a failure
+    # leaves it as it was for the per-cell fallback
+    header_style = _get_or_add_header_table_style(table, fill_hex, text_hex)
+    tbl_pr = table._tbl.tblPr
+    tbl_look = tbl_pr.find(qn('w:tblLook'))
+    look_val = tbl_look.get(_QN_VAL) if tbl_look is not None else None
+    if look_val is not None:
+        look_val = f"{int(look_val, 16) | 0x0020:04X}"
+    
+    table.style = header_style
+    
+    # Turn on the firstRow conditional format for this table
+    if tbl_look is None:
+        tbl_look = OxmlElement('w:tblLook')
+        tbl_pr.append(tbl_look)
+    tbl_look.set(qn('w:firstRow'), '1')
+    if look_val is not None:
+        tbl_look.set(_QN_VAL, look_val)
+    
+    # Mark the row as using the firstRow conditional format
+    tr_pr = header_row._tr.get_or_add_trPr()
+    existing_cnf = tr_pr.find(qn('w:cnfStyle'))
+    if existing_cnf is not None:
+        tr_pr.remove(existing_cnf)
+    cnf_style = OxmlElement('w:cnfStyle')
+    cnf_style.set(_QN_VAL, '100000000000')
+    cnf_style.set(qn('w:firstRow'), '1')
+    tr_pr.insert(0, cnf_style)
+    
+    # Direct cell and run formatting would take precedence over the table style
+    direct_formatting = './w:tc/w:tcPr/w:shd | ./w:tc/w:p/w:r/w:rPr/w:b'
+    if text_hex:
+        direct_formatting += ' | ./w:tc/w:p/w:r/w:rPr/w:color'
+    for element in header_row._tr.xpath(direct_formatting):
+        element.getparent().remove(element)
 
 
 def highlight_header_row(table, header_color="4472C4", text_color="FFFFFF"):
     """
     Apply special shading to header row.
     
+    The highlight is applied through a firstRow conditional format on the
+    table style; cells are formatted one by one only if that fails.
+    
     Args:
         table: The table to format
         header_color: Background color for header (hex string)
@@ -233,28 +705,33 @@ def highlight_header_row(table, header_color="4472C4", text_color="FFFFFF"):
         True if successful, False otherwise
     """
     try:
-        if table.rows:
-            for cell in table.rows[0].cells:
+        rows = list(table.rows)
+        if rows:
+            # Validate colors once for the whole row; an invalid text color is skipped
+            fill_hex = _validate_hex_color(header_color)
+            text_hex = _validate_hex_color(text_color) if text_color != "auto" else None
+            text_rgb = _hex_to_rgbcolor(text_hex) if text_hex else None
+            
+            try:
+                _apply_header_table_style(table, rows[0], fill_hex, text_hex)
+                return True
+            except Exception:
+                # Fall back to formatting each header cell
+                _log.debug("Error applying header table style", exc_info=True)
+            
+            for cell in rows[0].cells:
                 # Apply background shading
-                set_cell_shading(cell, fill_color=header_color)
+                _set_shading_on_tcpr(cell._tc.get_or_add_tcPr(), fill_hex)
                 
                 # Apply text formatting
                 for paragraph in cell.paragraphs:
                     for run in paragraph.runs:
                         run.bold = True
-                        if text_color and text_color != "auto":
-                            # Convert hex to RGB
-                            try:
-                                text_color = text_color.lstrip('#')
-                                r = int(text_color[0:2], 16)
-                                g = int(text_color[2:4], 16)
-                                b = int(text_color[4:6], 16)
-                                run.font.color.rgb = RGBColor(r, g, b)
-                            except:
-                                pass  # Skip if color format is invalid
+                        if text_rgb is not None:
+                            run.font.color.rgb = text_rgb
         return True
-    except Exception as e:
-        print(f"Error highlighting header row: {e}")
+    except Exception:
+        _log.debug("Error highlighting header row", exc_info=True)
         return False
 
 
@@ -273,14 +750,14 @@ def set_cell_shading_by_position(table, row_index, col_index, fill_color, patter
         True if successful, False otherwise
     """
     try:
-        if (0 <= row_index < len(table.rows) and 
-            0 <= col_index < len(table.rows[row_index].cells)):
-            cell = table.rows[row_index].cells[col_index]
-            return set_cell_shading(cell, fill_color=fill_color, pattern=pattern)
-        else:
-            return False
-    except Exception as e:
-        print(f"Error setting cell shading by position: {e}")
+        rows = table.rows
+        if 0 <= row_index < len(rows):
+            cells = rows[row_index].cells
+            if 0 <= col_index < len(cells):
+                return set_cell_shading(cells[col_index], fill_color=fill_color, pattern=pattern)
+        return False
+    except Exception:
+        _log.debug("Error setting cell shading by position", exc_info=True)
         return False
 
 
@@ -320,8 +797,8 @@ def merge_cells(table, start_row, start_col, end_row, end_col):
         
         return True
         
-    except Exception as e:
-        print(f"Error merging cells: {e}")
+    except Exception:
+        _log.debug("Error merging cells", exc_info=True)
         return False
 
 
@@ -402,8 +879,8 @@ def set_cell_alignment(cell, horizontal="left", vertical="top"):
         
         return True
         
-    except Exception as e:
-        print(f"Error setting cell alignment: {e}")
+    except Exception:
+        _log.debug("Error setting cell alignment", exc_info=True)
         return False
 
 
@@ -428,8 +905,8 @@ def set_cell_alignment_by_position(table, row_index, col_index, horizontal="left
             return set_cell_alignment(cell, horizontal, vertical)
         else:
             return False
-    except Exception as e:
-        print(f"Error setting cell alignment by position: {e}")
+    except Exception:
+        _log.debug("Error setting cell alignment by position", exc_info=True)
         return False
 
 
@@ -450,8 +927,8 @@ def set_table_alignment(table, horizontal="left", vertical="top"):
             for cell in row.cells:
                 set_cell_alignment(cell, horizontal, vertical)
         return True
-    except Exception as e:
-        print(f"Error setting table alignment: {e}")
+    except Exception:
+        _log.debug("Error setting table alignment", exc_info=True)
         return False
 
 
@@ -509,8 +986,8 @@ def set_column_width(table, col_index, width, width_type="dxa"):
         
         return True
         
-    except Exception as e:
-        print(f"Error setting column width: {e}")
+    except Exception:
+        _log.debug("Error setting column width", exc_info=True)
         return False
 
 
@@ -549,8 +1026,8 @@ def set_column_widths(table, widths, width_type="dxa"):
             if not set_column_width(table, col_index, width, width_type):
                 return False
         return True
-    except Exception as e:
-        print(f"Error setting column widths: {e}")
+    except Exception:
+        _log.debug("Error setting column widths", exc_info=True)
         return False
 
 
@@ -606,8 +1083,8 @@ def set_table_width(table, width, width_type="dxa"):
         
         return True
         
-    except Exception as e:
-        print(f"Error setting table width: {e}")
+    except Exception:
+        _log.debug("Error setting table width", exc_info=True)
         return False
 
 
@@ -648,8 +1125,8 @@ def auto_fit_table(table):
         
         return True
         
-    except Exception as e:
-        print(f"Error setting auto-fit table: {e}")
+    except Exception:
+        _log.debug("Error setting auto-fit table", exc_info=True)
         return False
 
 
@@ -694,25 +1171,10 @@ def format_cell_text(cell, text_content=None, bold=None, italic=None, underline=
                     run.font.name = font_name
                     
                 if color is not None:
-                    from docx.shared import RGBColor
-                    # Define common RGB colors
-                    color_map = {
-                        'red': RGBColor(255, 0, 0),
-                        'blue': RGBColor(0, 0, 255),
-                        'green': RGBColor(0, 128, 0),
-                        'yellow': RGBColor(255, 255, 0),
-                        'black': RGBColor(0, 0, 0),
-                        'gray': RGBColor(128, 128, 128),
-                        'grey': RGBColor(128, 128, 128),
-                        'white': RGBColor(255, 255, 255),
-                        'purple': RGBColor(128, 0, 128),
-                        'orange': RGBColor(255, 165, 0)
-                    }
-                    
                     try:
-                        if color.lower() in color_map:
+                        if color.lower() in _COLOR_MAP:
                             # Use predefined RGB color
-                            run.font.color.rgb = color_map[color.lower()]
+                            run.font.color.rgb = _COLOR_MAP[color.lower()]
                         elif color.startswith('#'):
                             # Hex color string
                             hex_color = color.lstrip('#')
@@ -734,8 +1196,8 @@ def format_cell_text(cell, text_content=None, bold=None, italic=None, underline=
         
         return True
         
-    except Exception as e:
-        print(f"Error formatting cell text: {e}")
+    except Exception:
+        _log.debug("Error formatting cell text", exc_info=True)
         return False
 
 
@@ -768,8 +1230,8 @@ def format_cell_text_by_position(table, row_index, col_index, text_content=None,
                                    color, font_size, font_name)
         else:
             return False
-    except Exception as e:
-        print(f"Error formatting cell text by position: {e}")
+    except Exception:
+        _log.debug("Error formatting cell text by position", exc_info=True)
         return False
 
 
@@ -831,8 +1293,8 @@ def set_cell_padding(cell, top=None, bottom=None, left=None, right=None, unit="d
         
         return True
         
-    except Exception as e:
-        print(f"Error setting cell padding: {e}")
+    except Exception:
+        _log.debug("Error setting cell padding", exc_info=True)
         return False
 
 
@@ -861,6 +1323,6 @@ def set_cell_padding_by_position(table, row_index, col_index, top=None, bottom=N
             return set_cell_padding(cell, top, bottom, left, right, unit)
         else:
             return False
-    except Exception as e:
-        print(f"Error setting cell padding by position: {e}")
+    except Exception:
+        _log.debug("Error setting cell padding by position", exc_info=True)
         return False
@@ -100,6 +100,13 @@ def register_tools():
         """
         return document_tools.copy_document(source_filename, destination_filename)
     
+    def close_document(filename: str):
+        """
+        Release the in-memory copy of a Word document kept between tool calls.
+        释放在工具调用之间缓存的Word文档内存副本。
+        """
+        return document_tools.close_document(filename)
+    
     def get_document_info(filename: str):
         """
         Get information about a Word document.
@@ -264,6 +271,13 @@ def register_tools():
         """
         return format_tools.highlight_table_header(filename, table_index, header_color, text_color)
     
+    def apply_format_batch(filename: str, operations: list):
+        """
+        Apply several formatting operations to a document, loading and saving it only once.
+        在Word文档中批量应用多个格式化操作，只加载和保存一次文档。
+        """
+        return format_tools.apply_format_batch(filename, operations)
+    
     # Cell merging tools
     def merge_table_cells(filename: str, table_index: int, start_row: int, start_col: int, 
                         end_row: int, end_col: int):
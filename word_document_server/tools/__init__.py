@@ -9,7 +9,7 @@ to clients through the Model Context Protocol.
 from word_document_server.tools.document_tools import (
     create_document, get_document_info, get_document_text, 
     get_document_outline, list_available_documents, 
-    copy_document, merge_documents
+    copy_document, merge_documents, close_document
 )
 
 # Content tools
@@ -21,7 +21,7 @@ from word_document_server.tools.content_tools import (
 
 # Format tools
 from word_document_server.tools.format_tools import (
-    format_text, create_custom_style, format_table
+    format_text, create_custom_style, format_table, apply_format_batch
 )
 
 # Protection tools
@@ -10,7 +10,7 @@ from docx import Document
 from docx.shared import Inches, Pt
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension
-from word_document_server.utils.document_utils import find_and_replace_text, insert_header_near_text, insert_numbered_list_near_text, insert_line_or_paragraph_near_text, replace_paragraph_block_below_header, replace_block_between_manual_anchors
+from word_document_server.utils.document_utils import find_and_replace_text, insert_header_near_text, insert_numbered_list_near_text, insert_line_or_paragraph_near_text, replace_paragraph_block_below_header, replace_block_between_manual_anchors, save_document
 from word_document_server.core.styles import ensure_heading_style, ensure_table_style
 
 
@@ -52,7 +52,7 @@ async def add_heading(filename: str, text: str, level: int = 1) -> str:
         # Try to add heading with style
         try:
             heading = doc.add_heading(text, level=level)
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Heading '{text}' (level {level}) added to {filename}"
         except Exception as style_error:
             # If style-based approach fails, use direct formatting
@@ -68,7 +68,7 @@ async def add_heading(filename: str, text: str, level: int = 1) -> str:
             else:
                 run.font.size = Pt(12)
             
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Heading '{text}' added to {filename} with direct formatting (style not available)"
     except Exception as e:
         return f"Failed to add heading: {str(e)}"
@@ -103,10 +103,10 @@ async def add_paragraph(filename: str, text: str, style: Optional[str] = None) -
             except KeyError:
                 # Style doesn't exist, use normal and report it
                 paragraph.style = doc.styles['Normal']
-                doc.save(filename)
+                save_document(doc, filename)
                 return f"Style '{style}' not found, paragraph added with default style to {filename}. Style '{style}' 不支持, 使用缺省的style添加段落到 {filename}"
         
-        doc.save(filename)
+        save_document(doc, filename)
         return f"Paragraph added to {filename}. 段落已经被添加到 {filename}"
     except Exception as e:
         return f"Failed to add paragraph, 添加段落失败: {str(e)}"
@@ -153,7 +153,7 @@ async def add_table(filename: str, rows: int, cols: int, data: Optional[List[Lis
                         break
                     table.cell(i, j).text = str(cell_text)
         
-        doc.save(filename)
+        save_document(doc, filename)
         return f"Table ({rows}x{cols}) added to {filename}"
     except Exception as e:
         return f"Failed to add table: {str(e)}"
@@ -204,7 +204,7 @@ async def add_picture(filename: str, image_path: str, width: Optional[float] = N
                 doc.add_picture(abs_image_path, width=Inches(width))
             else:
                 doc.add_picture(abs_image_path)
-            doc.save(abs_filename)
+            save_document(doc, abs_filename)
             return f"Picture {image_path} added to {filename}"
         except Exception as inner_error:
             # More detailed error for the specific operation
@@ -237,7 +237,7 @@ async def add_page_break(filename: str) -> str:
     try:
         doc = Document(filename)
         doc.add_page_break()
-        doc.save(filename)
+        save_document(doc, filename)
         return f"Page break added to {filename}."
     except Exception as e:
         return f"Failed to add page break: {str(e)}"
@@ -325,7 +325,7 @@ async def add_table_of_contents(filename: str, title: str = "Table of Contents",
                         new_table.cell(i, j).text = paragraph.text
         
         # Save the new document with TOC
-        toc_doc.save(filename)
+        save_document(toc_doc, filename)
         
         return f"Table of contents with {len(headings)} entries added to {filename}"
     except Exception as e:
@@ -362,7 +362,7 @@ async def delete_paragraph(filename: str, paragraph_index: int) -> str:
         p = paragraph._p
         p.getparent().remove(p)
         
-        doc.save(filename)
+        save_document(doc, filename)
         return f"Paragraph at index {paragraph_index} deleted successfully."
     except Exception as e:
         return f"Failed to delete paragraph: {str(e)}"
@@ -393,7 +393,7 @@ async def search_and_replace(filename: str, find_text: str, replace_text: str) -
         count = find_and_replace_text(doc, find_text, replace_text)
         
         if count > 0:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Replaced {count} occurrence(s) of '{find_text}' with '{replace_text}'."
         else:
             return f"No occurrences of '{find_text}' found."
@@ -7,7 +7,7 @@ from typing import Dict, List, Optional, Any
 from docx import Document
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension, create_document_copy
-from word_document_server.utils.document_utils import get_document_properties, extract_document_text, get_document_structure, get_document_xml, insert_header_near_text, insert_line_or_paragraph_near_text
+from word_document_server.utils.document_utils import get_document_properties, extract_document_text, get_document_structure, get_document_xml, insert_header_near_text, insert_line_or_paragraph_near_text, save_document, close_document as close_cached_document
 from word_document_server.core.styles import ensure_heading_style, ensure_table_style
 
 
@@ -40,7 +40,7 @@ async def create_document(filename: str, title: Optional[str] = None, author: Op
         ensure_table_style(doc)
         
         # Save the document
-        doc.save(filename)
+        save_document(doc, filename)
         
         return f"Document '{filename}' created successfully, '{filename}' 创建成功"
     except Exception as e:
@@ -128,11 +128,25 @@ async def copy_document(source_filename: str, destination_filename: Optional[str
     
     success, message, new_path = create_document_copy(source_filename, destination_filename)
     if success:
+        close_cached_document(new_path)
         return message
     else:
         return f"Failed to copy document: {message}"
 
 
+async def close_document(filename: str) -> str:
+    """Release the in-memory copy of a Word document kept between tool calls.
+    
+    Args:
+        filename: Path to the Word document
+    """
+    filename = ensure_docx_extension(filename)
+    
+    if close_cached_document(filename):
+        return f"Document {filename} closed successfully"
+    return f"Document {filename} was not open"
+
+
 async def merge_documents(target_filename: str, source_filenames: List[str], add_page_breaks: bool = True) -> str:
     """Merge multiple Word documents into a single document.
     
@@ -203,7 +217,7 @@ async def merge_documents(target_filename: str, source_filenames: List[str], add
                 copy_table(table, target_doc)
         
         # Save the merged document
-        target_doc.save(target_filename)
+        save_document(target_doc, target_filename)
         return f"Successfully merged {len(source_filenames)} documents into {target_filename}"
     except Exception as e:
         return f"Failed to merge documents: {str(e)}"
@@ -15,6 +15,7 @@ from docx.shared import Pt
 from docx.enum.style import WD_STYLE_TYPE
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension
+from word_document_server.utils.document_utils import save_document, close_document
 from word_document_server.core.footnotes import (
     find_footnote_references,
     get_format_symbols,
@@ -67,7 +68,7 @@ async def add_footnote_to_document(filename: str, paragraph_index: int, footnote
             # Create the footnote reference
             reference = footnote.add_footnote(footnote_text)
             
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Footnote added to paragraph {paragraph_index} in {filename}"
         except AttributeError:
             # Fall back to a simpler approach if direct footnote addition fails
@@ -90,7 +91,7 @@ async def add_footnote_to_document(filename: str, paragraph_index: int, footnote
             footnote_para = doc.add_paragraph("¹ " + footnote_text)
             footnote_para.style = "Footnote Text" if "Footnote Text" in doc.styles else "Normal"
             
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Footnote added to paragraph {paragraph_index} in {filename} (simplified approach)"
     except Exception as e:
         return f"Failed to add footnote: {str(e)}"
@@ -150,7 +151,7 @@ async def add_endnote_to_document(filename: str, paragraph_index: int, endnote_t
         endnote_para = doc.add_paragraph("† " + endnote_text)
         endnote_para.style = "Endnote Text" if "Endnote Text" in doc.styles else "Normal"
         
-        doc.save(filename)
+        save_document(doc, filename)
         return f"Endnote added to paragraph {paragraph_index} in {filename}"
     except Exception as e:
         return f"Failed to add endnote: {str(e)}"
@@ -233,7 +234,7 @@ async def convert_footnotes_to_endnotes_in_document(filename: str) -> str:
                 pass
         
         # Save the document
-        doc.save(filename)
+        save_document(doc, filename)
         
         return f"Converted {len(footnote_references)} footnotes to endnotes in {filename}"
     except Exception as e:
@@ -272,6 +273,7 @@ async def add_footnote_after_text(filename: str, search_text: str, footnote_text
             position="after",
             validate_location=True
         )
+        close_document(output_filename or filename)
         return message
     except Exception as e:
         return f"Failed to add footnote: {str(e)}"
@@ -309,6 +311,7 @@ async def add_footnote_before_text(filename: str, search_text: str, footnote_tex
             position="before",
             validate_location=True
         )
+        close_document(output_filename or filename)
         return message
     except Exception as e:
         return f"Failed to add footnote: {str(e)}"
@@ -351,6 +354,7 @@ async def add_footnote_enhanced(filename: str, paragraph_index: int, footnote_te
             output_filename=output_filename,
             validate_location=True
         )
+        close_document(output_filename or filename)
         return message
     except Exception as e:
         return f"Failed to add footnote: {str(e)}"
@@ -408,7 +412,7 @@ async def customize_footnote_style(filename: str, numbering_format: str = "1, 2,
         count = customize_footnote_formatting(doc, footnote_refs, format_symbols, start_number, footnote_style)
         
         # Save the document
-        doc.save(filename)
+        save_document(doc, filename)
         
         return f"Footnote style and numbering customized in {filename}"
     except Exception as e:
@@ -449,6 +453,7 @@ async def delete_footnote_from_document(filename: str, footnote_id: Optional[int
             output_filename=output_filename,
             clean_orphans=True
         )
+        close_document(output_filename or filename)
         return message
     except Exception as e:
         return f"Failed to delete footnote: {str(e)}"
@@ -514,6 +519,7 @@ async def add_footnote_robust_tool(
         validate_location=validate_location,
         auto_repair=auto_repair
     )
+    close_document(filename)
     
     return {
         "success": success,
@@ -569,6 +575,7 @@ async def delete_footnote_robust_tool(
         search_text=search_text,
         clean_orphans=clean_orphans
     )
+    close_document(filename)
     
     return {
         "success": success,
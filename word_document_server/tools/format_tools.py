@@ -4,17 +4,23 @@ Formatting tools for Word Document Server.
 These tools handle formatting operations for Word documents,
 including text formatting, table formatting, and custom styles.
 """
+import copy
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_COLOR_INDEX
 from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.text.run import Run
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension
+from word_document_server.utils.document_utils import (
+    load_document, save_document, close_document
+)
 from word_document_server.core.styles import create_style
 from word_document_server.core.tables import (
-    apply_table_style, set_cell_shading_by_position, apply_alternating_row_shading,
+    apply_table_style, set_cell_shading, apply_alternating_row_shading,
     highlight_header_row, merge_cells, merge_cells_horizontal, merge_cells_vertical,
     set_cell_alignment_by_position, set_table_alignment, set_column_width_by_position,
     set_column_widths, set_table_width as set_table_width_func, auto_fit_table,
@@ -22,26 +28,98 @@ from word_document_server.core.tables import (
 )
 
 
-async def format_text(filename: str, paragraph_index: int, start_pos: int, end_pos: int, 
-                     bold: Optional[bool] = None, italic: Optional[bool] = None, 
-                     underline: Optional[bool] = None, color: Optional[str] = None,
-                     font_size: Optional[int] = None, font_name: Optional[str] = None) -> str:
-    """Format a specific range of text within a paragraph.
+# Common RGB colors accepted by format_text
+_COLOR_MAP = {
+    'red': RGBColor(255, 0, 0),
+    'blue': RGBColor(0, 0, 255),
+    'green': RGBColor(0, 128, 0),
+    'yellow': RGBColor(255, 255, 0),
+    'black': RGBColor(0, 0, 0),
+    'gray': RGBColor(128, 128, 128),
+    'white': RGBColor(255, 255, 255),
+    'purple': RGBColor(128, 0, 128),
+    'orange': RGBColor(255, 165, 0)
+}
+
+# Run children that contribute to the run's text, as counted by paragraph.text
+_RUN_CONTENT_TAGS = frozenset(
+    qn(f'w:{tag}') for tag in ('br', 'cr', 'noBreakHyphen', 'ptab', 't', 'tab')
+)
+_QN_RPR = qn('w:rPr')
+
+
+def _trim_run(r, start: int, end: Optional[int] = None) -> None:
+    """Keep only the characters [start, end) of a w:r element's content.
     
-    Args:
-        filename: Path to the Word document
-        paragraph_index: Index of the paragraph (0-based)
-        start_pos: Start position within the paragraph text
-        end_pos: End position within the paragraph text
-        bold: Set text bold (True/False)
-        italic: Set text italic (True/False)
-        underline: Set text underlined (True/False)
-        color: Text color (e.g., 'red', 'blue', etc.)
-        font_size: Font size in points
-        font_name: Font name/family
+    Children without text, such as drawings, field characters and note
+    references, are kept only if they sit inside the range, so each of them
+    ends up on exactly one side of a split.
     """
-    filename = ensure_docx_extension(filename)
+    pos = 0
+    for child in list(r):
+        if child.tag == _QN_RPR:
+            continue
+        child_text = str(child) if child.tag in _RUN_CONTENT_TAGS else ''
+        child_start, child_end = pos, pos + len(child_text)
+        pos = child_end
+        keep_start = max(child_start, start)
+        keep_end = child_end if end is None else min(child_end, end)
+        
+        if not child_text:
+            # Zero-width content stays on the side it sits on
+            if child_start < start or (end is not None and child_start >= end):
+                r.remove(child)
+        elif keep_start >= keep_end:
+            r.remove(child)
+        elif (keep_start, keep_end) != (child_start, child_end):
+            # Only w:t holds more than one character
+            child.text = child_text[keep_start - child_start:keep_end - child_start]
+            child.set(qn('xml:space'), 'preserve')
+
+
+def _split_run(r, offset: int):
+    """Split a w:r element at a character offset and return the new right-hand w:r.
     
+    Both halves keep the original run properties.
+    """
+    right = copy.deepcopy(r)
+    _trim_run(r, 0, offset)
+    _trim_run(right, offset)
+    r.addnext(right)
+    return right
+
+
+def _isolate_text_range(p, start_pos: int, end_pos: int) -> List[Any]:
+    """Split the runs of a w:p element so [start_pos, end_pos) is covered by whole runs.
+    
+    Returns:
+        The w:r elements covering the range, in document order
+    """
+    targets = []
+    pos = 0
+    for r in p.xpath("w:r | w:hyperlink/w:r"):
+        r_start, r_end = pos, pos + len(r.text)
+        pos = r_end
+        if r_end <= start_pos or r_start >= end_pos:
+            continue
+        if r_start < start_pos:
+            r = _split_run(r, start_pos - r_start)
+            r_start = start_pos
+        if r_end > end_pos:
+            _split_run(r, end_pos - r_start)
+        targets.append(r)
+    return targets
+
+
+def _format_text_op(doc, paragraph_index: int, start_pos: int, end_pos: int,
+                    bold: Optional[bool] = None, italic: Optional[bool] = None,
+                    underline: Optional[bool] = None, color: Optional[str] = None,
+                    font_size: Optional[int] = None, font_name: Optional[str] = None) -> Tuple[bool, str]:
+    """Format a specific range of text within a paragraph of an open document.
+    
+    Returns:
+        Tuple of (success, message)
+    """
     # Ensure numeric parameters are the correct type
     try:
         paragraph_index = int(paragraph_index)
@@ -50,86 +128,286 @@ async def format_text(filename: str, paragraph_index: int, start_pos: int, end_p
         if font_size is not None:
             font_size = int(font_size)
     except (ValueError, TypeError):
-        return "Invalid parameter: paragraph_index, start_pos, end_pos, and font_size must be integers"
-    
-    if not os.path.exists(filename):
-        return f"Document {filename} does not exist"
-    
-    # Check if file is writeable
-    is_writeable, error_message = check_file_writeable(filename)
-    if not is_writeable:
-        return f"Cannot modify document: {error_message}. Consider creating a copy first."
+        return False, "Invalid parameter: paragraph_index, start_pos, end_pos, and font_size must be integers"
     
     try:
-        doc = Document(filename)
-        
         # Validate paragraph index
-        if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
-            return f"Invalid paragraph index. Document has {len(doc.paragraphs)} paragraphs (0-{len(doc.paragraphs)-1})."
+        paragraphs = doc.paragraphs
+        num_paragraphs = len(paragraphs)
+        if not 0 <= paragraph_index < num_paragraphs:
+            return False, f"Invalid paragraph index. Document has {num_paragraphs} paragraphs (0-{num_paragraphs-1})."
         
-        paragraph = doc.paragraphs[paragraph_index]
+        paragraph = paragraphs[paragraph_index]
         text = paragraph.text
+        text_length = len(text)
         
         # Validate text positions
-        if start_pos < 0 or end_pos > len(text) or start_pos >= end_pos:
-            return f"Invalid text positions. Paragraph has {len(text)} characters."
+        if not 0 <= start_pos < end_pos <= text_length:
+            return False, f"Invalid text positions. Paragraph has {text_length} characters."
         
-        # Get the text to format
-        target_text = text[start_pos:end_pos]
+        # Split the runs at the range boundaries; runs outside it are left as they are
+        for r in _isolate_text_range(paragraph._p, start_pos, end_pos):
+            _apply_run_format(Run(r, paragraph), bold, italic, underline, color, font_size, font_name)
         
-        # Clear existing runs and create three runs: before, target, after
-        for run in paragraph.runs:
-            run.clear()
+        return True, f"Text '{text[start_pos:end_pos]}' formatted successfully in paragraph {paragraph_index}."
+    except Exception as e:
+        return False, f"Failed to format text: {str(e)}"
+
+
+def _apply_run_format(run_target, bold=None, italic=None, underline=None,
+                      color=None, font_size=None, font_name=None):
+    """Apply text formatting to a single run, leaving unspecified properties as they are."""
+    if bold is not None:
+        run_target.bold = bold
+    if italic is not None:
+        run_target.italic = italic
+    if underline is not None:
+        run_target.underline = underline
+    if color:
+        try:
+            if color.lower() in _COLOR_MAP:
+                # Use predefined RGB color
+                run_target.font.color.rgb = _COLOR_MAP[color.lower()]
+            else:
+                # Try to set color by name
+                run_target.font.color.rgb = RGBColor.from_string(color)
+        except Exception as e:
+            # If all else fails, default to black
+            run_target.font.color.rgb = RGBColor(0, 0, 0)
+    if font_size:
+        run_target.font.size = Pt(font_size)
+    if font_name:
+        run_target.font.name = font_name
+
+
+def _format_table_op(doc, table_index: int,
+                     has_header_row: Optional[bool] = None,
+                     border_style: Optional[str] = None,
+                     shading: Optional[List[List[str]]] = None) -> Tuple[bool, str]:
+    """Format a table of an open document with borders, shading, and structure.
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    try:
+        # Validate table index
+        tables = doc.tables
+        num_tables = len(tables)
+        if not 0 <= table_index < num_tables:
+            return False, f"Invalid table index. Document has {num_tables} tables (0-{num_tables-1})."
         
-        # Add text before target
-        if start_pos > 0:
-            run_before = paragraph.add_run(text[:start_pos])
+        table = tables[table_index]
         
-        # Add target text with formatting
-        run_target = paragraph.add_run(target_text)
-        if bold is not None:
-            run_target.bold = bold
-        if italic is not None:
-            run_target.italic = italic
-        if underline is not None:
-            run_target.underline = underline
-        if color:
-            # Define common RGB colors
-            color_map = {
-                'red': RGBColor(255, 0, 0),
-                'blue': RGBColor(0, 0, 255),
-                'green': RGBColor(0, 128, 0),
-                'yellow': RGBColor(255, 255, 0),
-                'black': RGBColor(0, 0, 0),
-                'gray': RGBColor(128, 128, 128),
-                'white': RGBColor(255, 255, 255),
-                'purple': RGBColor(128, 0, 128),
-                'orange': RGBColor(255, 165, 0)
-            }
+        # Apply formatting
+        if apply_table_style(table, has_header_row or False, border_style, shading):
+            return True, f"Table at index {table_index} formatted successfully."
+        else:
+            return False, f"Failed to format table at index {table_index}."
+    except Exception as e:
+        return False, f"Failed to format table: {str(e)}"
+
+
+def _shade_cell_op(doc, table_index: int, row_index: int, col_index: int,
+                   fill_color: str, pattern: str = "clear") -> Tuple[bool, str]:
+    """Apply shading/filling to a specific table cell of an open document.
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    # Ensure numeric parameters are the correct type
+    try:
+        table_index = int(table_index)
+        row_index = int(row_index)
+        col_index = int(col_index)
+    except (ValueError, TypeError):
+        return False, "Invalid parameter: table_index, row_index, and col_index must be integers"
+    
+    try:
+        # Validate table index
+        tables = doc.tables
+        num_tables = len(tables)
+        if not 0 <= table_index < num_tables:
+            return False, f"Invalid table index. Document has {num_tables} tables (0-{num_tables-1})."
+        
+        table = tables[table_index]
+        
+        # Validate row and column indices
+        rows = table.rows
+        num_rows = len(rows)
+        if not 0 <= row_index < num_rows:
+            return False, f"Invalid row index. Table has {num_rows} rows (0-{num_rows-1})."
+        
+        cells = rows[row_index].cells
+        num_cells = len(cells)
+        if not 0 <= col_index < num_cells:
+            return False, f"Invalid column index. Row has {num_cells} cells (0-{num_cells-1})."
+        
+        # Apply cell shading
+        if set_cell_shading(cells[col_index], fill_color=fill_color, pattern=pattern):
+            return True, f"Cell shading applied successfully to table {table_index}, row {row_index}, column {col_index}."
+        else:
+            return False, f"Failed to apply cell shading."
+    except Exception as e:
+        return False, f"Failed to apply cell shading: {str(e)}"
+
+
+def _alternating_rows_op(doc, table_index: int,
+                         color1: str = "FFFFFF", color2: str = "F2F2F2") -> Tuple[bool, str]:
+    """Apply alternating row colors to a table of an open document.
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    # Ensure numeric parameters are the correct type
+    try:
+        table_index = int(table_index)
+    except (ValueError, TypeError):
+        return False, "Invalid parameter: table_index must be an integer"
+    
+    try:
+        # Validate table index
+        tables = doc.tables
+        num_tables = len(tables)
+        if not 0 <= table_index < num_tables:
+            return False, f"Invalid table index. Document has {num_tables} tables (0-{num_tables-1})."
+        
+        table = tables[table_index]
+        
+        # Apply alternating row shading
+        if apply_alternating_row_shading(table, color1, color2):
+            return True, f"Alternating row shading applied successfully to table {table_index}."
+        else:
+            return False, f"Failed to apply alternating row shading."
+    except Exception as e:
+        return False, f"Failed to apply alternating row shading: {str(e)}"
+
+
+def _highlight_header_op(doc, table_index: int,
+                         header_color: str = "4472C4", text_color: str = "FFFFFF") -> Tuple[bool, str]:
+    """Apply special highlighting to the header row of a table of an open document.
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    # Ensure numeric parameters are the correct type
+    try:
+        table_index = int(table_index)
+    except (ValueError, TypeError):
+        return False, "Invalid parameter: table_index must be an integer"
+    
+    try:
+        # Validate table index
+        tables = doc.tables
+        num_tables = len(tables)
+        if not 0 <= table_index < num_tables:
+            return False, f"Invalid table index. Document has {num_tables} tables (0-{num_tables-1})."
+        
+        table = tables[table_index]
+        
+        # Apply header highlighting
+        if highlight_header_row(table, header_color, text_color):
+            return True, f"Header highlighting applied successfully to table {table_index}."
+        else:
+            return False, f"Failed to apply header highlighting."
+    except Exception as e:
+        return False, f"Failed to apply header highlighting: {str(e)}"
+
+
+# Operations accepted by apply_format_batch, keyed by their "op" name
+_FORMAT_OPERATIONS = {
+    "format_text": _format_text_op,
+    "format_table": _format_table_op,
+    "shade_cell": _shade_cell_op,
+    "alternating_rows": _alternating_rows_op,
+    "highlight_header": _highlight_header_op,
+}
+
+
+async def apply_format_batch(filename: str, operations: List[Dict[str, Any]]) -> str:
+    """Apply several formatting operations to a document, loading and saving it once.
+    
+    Each operation is a dict with an "op" key naming the operation and the
+    remaining keys as its parameters, e.g.
+    {"op": "shade_cell", "table_index": 0, "row_index": 1, "col_index": 2, "fill_color": "FF0000"}.
+    Supported operations: format_text, format_table, shade_cell,
+    alternating_rows, highlight_header. If any operation fails, nothing is saved.
+    
+    Args:
+        filename: Path to the Word document
+        operations: List of operations to apply, in order
+    """
+    filename = ensure_docx_extension(filename)
+    
+    if not isinstance(operations, list) or not operations:
+        return "Invalid parameter: operations must be a non-empty list of format operations"
+    for i, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            return f"Invalid format operation at index {i}: expected a dict with an 'op' key"
+    
+    if not os.path.exists(filename):
+        return f"Document {filename} does not exist"
+    
+    # Writeability is checked by the save itself at the end of the batch
+    saved = False
+    try:
+        doc = load_document(filename)
+        
+        messages = []
+        for i, operation in enumerate(operations):
+            params = dict(operation)
+            op = params.pop("op", None)
+            handler = _FORMAT_OPERATIONS.get(op)
+            if handler is None:
+                return f"Unknown format operation '{op}' at index {i}. Supported operations: {', '.join(_FORMAT_OPERATIONS)}."
             
             try:
-                if color.lower() in color_map:
-                    # Use predefined RGB color
-                    run_target.font.color.rgb = color_map[color.lower()]
-                else:
-                    # Try to set color by name
-                    run_target.font.color.rgb = RGBColor.from_string(color)
-            except Exception as e:
-                # If all else fails, default to black
-                run_target.font.color.rgb = RGBColor(0, 0, 0)
-        if font_size:
-            run_target.font.size = Pt(font_size)
-        if font_name:
-            run_target.font.name = font_name
-        
-        # Add text after target
-        if end_pos < len(text):
-            run_after = paragraph.add_run(text[end_pos:])
-        
-        doc.save(filename)
-        return f"Text '{target_text}' formatted successfully in paragraph {paragraph_index}."
+                success, message = handler(doc, **params)
+            except TypeError as e:
+                return f"Invalid parameters for format operation '{op}' at index {i}: {str(e)}"
+            if not success:
+                if len(operations) > 1:
+                    return f"Format operation '{op}' at index {i} failed, no changes saved: {message}"
+                return message
+            messages.append(message)
+        
+        try:
+            save_document(doc, filename, keep_open=True)
+        except PermissionError as e:
+            return f"Cannot modify document: {str(e)}. Consider creating a copy first."
+        saved = True
+        return "\n".join(messages)
     except Exception as e:
-        return f"Failed to format text: {str(e)}"
+        return f"Failed to apply format operations: {str(e)}"
+    finally:
+        if not saved:
+            # Earlier operations may have modified the cached document
+            close_document(filename)
+
+
+async def format_text(filename: str, paragraph_index: int, start_pos: int, end_pos: int, 
+                     bold: Optional[bool] = None, italic: Optional[bool] = None, 
+                     underline: Optional[bool] = None, color: Optional[str] = None,
+                     font_size: Optional[int] = None, font_name: Optional[str] = None) -> str:
+    """Format a specific range of text within a paragraph.
+    
+    Args:
+        filename: Path to the Word document
+        paragraph_index: Index of the paragraph (0-based)
+        start_pos: Start position within the paragraph text
+        end_pos: End position within the paragraph text
+        bold: Set text bold (True/False)
+        italic: Set text italic (True/False)
+        underline: Set text underlined (True/False)
+        color: Text color (e.g., 'red', 'blue', etc.)
+        font_size: Font size in points
+        font_name: Font name/family
+    """
+    return await apply_format_batch(filename, [{
+        "op": "format_text", "paragraph_index": paragraph_index,
+        "start_pos": start_pos, "end_pos": end_pos,
+        "bold": bold, "italic": italic, "underline": underline, "color": color,
+        "font_size": font_size, "font_name": font_name
+    }])
 
 
 async def create_custom_style(filename: str, style_name: str, 
@@ -183,7 +461,7 @@ async def create_custom_style(filename: str, style_name: str,
             font_properties=font_properties
         )
         
-        doc.save(filename)
+        save_document(doc, filename)
         return f"Style '{style_name}' created successfully."
     except Exception as e:
         return f"Failed to create style: {str(e)}"
@@ -202,35 +480,10 @@ async def format_table(filename: str, table_index: int,
         border_style: Style for borders ('none', 'single', 'double', 'thick')
         shading: 2D list of cell background colors (by row and column)
     """
-    filename = ensure_docx_extension(filename)
-    
-    if not os.path.exists(filename):
-        return f"Document {filename} does not exist"
-    
-    # Check if file is writeable
-    is_writeable, error_message = check_file_writeable(filename)
-    if not is_writeable:
-        return f"Cannot modify document: {error_message}. Consider creating a copy first."
-    
-    try:
-        doc = Document(filename)
-        
-        # Validate table index
-        if table_index < 0 or table_index >= len(doc.tables):
-            return f"Invalid table index. Document has {len(doc.tables)} tables (0-{len(doc.tables)-1})."
-        
-        table = doc.tables[table_index]
-        
-        # Apply formatting
-        success = apply_table_style(table, has_header_row or False, border_style, shading)
-        
-        if success:
-            doc.save(filename)
-            return f"Table at index {table_index} formatted successfully."
-        else:
-            return f"Failed to format table at index {table_index}."
-    except Exception as e:
-        return f"Failed to format table: {str(e)}"
+    return await apply_format_batch(filename, [{
+        "op": "format_table", "table_index": table_index,
+        "has_header_row": has_header_row, "border_style": border_style, "shading": shading
+    }])
 
 
 async def set_table_cell_shading(filename: str, table_index: int, row_index: int, 
@@ -245,50 +498,10 @@ async def set_table_cell_shading(filename: str, table_index: int, row_index: int
         fill_color: Background color (hex string like "FF0000" or "red")
         pattern: Shading pattern ("clear", "solid", "pct10", "pct20", etc.)
     """
-    filename = ensure_docx_extension(filename)
-    
-    # Ensure numeric parameters are the correct type
-    try:
-        table_index = int(table_index)
-        row_index = int(row_index)
-        col_index = int(col_index)
-    except (ValueError, TypeError):
-        return "Invalid parameter: table_index, row_index, and col_index must be integers"
-    
-    if not os.path.exists(filename):
-        return f"Document {filename} does not exist"
-    
-    # Check if file is writeable
-    is_writeable, error_message = check_file_writeable(filename)
-    if not is_writeable:
-        return f"Cannot modify document: {error_message}. Consider creating a copy first."
-    
-    try:
-        doc = Document(filename)
-        
-        # Validate table index
-        if table_index < 0 or table_index >= len(doc.tables):
-            return f"Invalid table index. Document has {len(doc.tables)} tables (0-{len(doc.tables)-1})."
-        
-        table = doc.tables[table_index]
-        
-        # Validate row and column indices
-        if row_index < 0 or row_index >= len(table.rows):
-            return f"Invalid row index. Table has {len(table.rows)} rows (0-{len(table.rows)-1})."
-        
-        if col_index < 0 or col_index >= len(table.rows[row_index].cells):
-            return f"Invalid column index. Row has {len(table.rows[row_index].cells)} cells (0-{len(table.rows[row_index].cells)-1})."
-        
-        # Apply cell shading
-        success = set_cell_shading_by_position(table, row_index, col_index, fill_color, pattern)
-        
-        if success:
-            doc.save(filename)
-            return f"Cell shading applied successfully to table {table_index}, row {row_index}, column {col_index}."
-        else:
-            return f"Failed to apply cell shading."
-    except Exception as e:
-        return f"Failed to apply cell shading: {str(e)}"
+    return await apply_format_batch(filename, [{
+        "op": "shade_cell", "table_index": table_index, "row_index": row_index,
+        "col_index": col_index, "fill_color": fill_color, "pattern": pattern
+    }])
 
 
 async def apply_table_alternating_rows(filename: str, table_index: int, 
@@ -301,41 +514,10 @@ async def apply_table_alternating_rows(filename: str, table_index: int,
         color1: Color for odd rows (hex string, default white)
         color2: Color for even rows (hex string, default light gray)
     """
-    filename = ensure_docx_extension(filename)
-    
-    # Ensure numeric parameters are the correct type
-    try:
-        table_index = int(table_index)
-    except (ValueError, TypeError):
-        return "Invalid parameter: table_index must be an integer"
-    
-    if not os.path.exists(filename):
-        return f"Document {filename} does not exist"
-    
-    # Check if file is writeable
-    is_writeable, error_message = check_file_writeable(filename)
-    if not is_writeable:
-        return f"Cannot modify document: {error_message}. Consider creating a copy first."
-    
-    try:
-        doc = Document(filename)
-        
-        # Validate table index
-        if table_index < 0 or table_index >= len(doc.tables):
-            return f"Invalid table index. Document has {len(doc.tables)} tables (0-{len(doc.tables)-1})."
-        
-        table = doc.tables[table_index]
-        
-        # Apply alternating row shading
-        success = apply_alternating_row_shading(table, color1, color2)
-        
-        if success:
-            doc.save(filename)
-            return f"Alternating row shading applied successfully to table {table_index}."
-        else:
-            return f"Failed to apply alternating row shading."
-    except Exception as e:
-        return f"Failed to apply alternating row shading: {str(e)}"
+    return await apply_format_batch(filename, [{
+        "op": "alternating_rows", "table_index": table_index,
+        "color1": color1, "color2": color2
+    }])
 
 
 async def highlight_table_header(filename: str, table_index: int, 
@@ -348,41 +530,10 @@ async def highlight_table_header(filename: str, table_index: int,
         header_color: Background color for header (hex string, default blue)
         text_color: Text color for header (hex string, default white)
     """
-    filename = ensure_docx_extension(filename)
-    
-    # Ensure numeric parameters are the correct type
-    try:
-        table_index = int(table_index)
-    except (ValueError, TypeError):
-        return "Invalid parameter: table_index must be an integer"
-    
-    if not os.path.exists(filename):
-        return f"Document {filename} does not exist"
-    
-    # Check if file is writeable
-    is_writeable, error_message = check_file_writeable(filename)
-    if not is_writeable:
-        return f"Cannot modify document: {error_message}. Consider creating a copy first."
-    
-    try:
-        doc = Document(filename)
-        
-        # Validate table index
-        if table_index < 0 or table_index >= len(doc.tables):
-            return f"Invalid table index. Document has {len(doc.tables)} tables (0-{len(doc.tables)-1})."
-        
-        table = doc.tables[table_index]
-        
-        # Apply header highlighting
-        success = highlight_header_row(table, header_color, text_color)
-        
-        if success:
-            doc.save(filename)
-            return f"Header highlighting applied successfully to table {table_index}."
-        else:
-            return f"Failed to apply header highlighting."
-    except Exception as e:
-        return f"Failed to apply header highlighting: {str(e)}"
+    return await apply_format_batch(filename, [{
+        "op": "highlight_header", "table_index": table_index,
+        "header_color": header_color, "text_color": text_color
+    }])
 
 
 async def merge_table_cells(filename: str, table_index: int, start_row: int, start_col: int, 
@@ -437,7 +588,7 @@ async def merge_table_cells(filename: str, table_index: int, start_row: int, sta
         success = merge_cells(table, start_row, start_col, end_row, end_col)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Cells merged successfully in table {table_index} from ({start_row},{start_col}) to ({end_row},{end_col})."
         else:
             return f"Failed to merge cells. Check that indices are valid."
@@ -488,7 +639,7 @@ async def merge_table_cells_horizontal(filename: str, table_index: int, row_inde
         success = merge_cells_horizontal(table, row_index, start_col, end_col)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Cells merged horizontally in table {table_index}, row {row_index}, columns {start_col}-{end_col}."
         else:
             return f"Failed to merge cells horizontally. Check that indices are valid."
@@ -539,7 +690,7 @@ async def merge_table_cells_vertical(filename: str, table_index: int, col_index:
         success = merge_cells_vertical(table, col_index, start_row, end_row)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Cells merged vertically in table {table_index}, column {col_index}, rows {start_row}-{end_row}."
         else:
             return f"Failed to merge cells vertically. Check that indices are valid."
@@ -600,7 +751,7 @@ async def set_table_cell_alignment(filename: str, table_index: int, row_index: i
         success = set_cell_alignment_by_position(table, row_index, col_index, horizontal, vertical)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Cell alignment set successfully for table {table_index}, cell ({row_index},{col_index}) to {horizontal}/{vertical}."
         else:
             return f"Failed to set cell alignment. Check that indices are valid."
@@ -657,7 +808,7 @@ async def set_table_alignment_all(filename: str, table_index: int,
         success = set_table_alignment(table, horizontal, vertical)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Table alignment set successfully for table {table_index} to {horizontal}/{vertical} for all cells."
         else:
             return f"Failed to set table alignment."
@@ -738,7 +889,7 @@ async def set_table_column_width(filename: str, table_index: int, col_index: int
         success = set_column_width_by_position(table, col_index, word_width, word_type)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Column width set successfully for table {table_index}, column {col_index} to {width} {width_type}."
         else:
             return f"Failed to set column width. Check that indices are valid."
@@ -814,7 +965,7 @@ async def set_table_column_widths(filename: str, table_index: int, widths: list,
         success = set_column_widths(table, word_widths, word_type)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Column widths set successfully for table {table_index} with {len(widths)} columns in {width_type}."
         else:
             return f"Failed to set column widths."
@@ -885,7 +1036,7 @@ async def set_table_width(filename: str, table_index: int, width: float,
         success = set_table_width_func(table, word_width, word_type)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Table width set successfully for table {table_index} to {width} {width_type}."
         else:
             return f"Failed to set table width."
@@ -929,7 +1080,7 @@ async def auto_fit_table_columns(filename: str, table_index: int) -> str:
         success = auto_fit_table(table)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             return f"Table {table_index} set to auto-fit columns based on content."
         else:
             return f"Failed to set table auto-fit."
@@ -997,7 +1148,7 @@ async def format_table_cell_text(filename: str, table_index: int, row_index: int
                                               bold, italic, underline, color, font_size, font_name)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             format_desc = []
             if text_content is not None:
                 format_desc.append(f"content='{text_content[:30]}{'...' if len(text_content) > 30 else ''}'")
@@ -1093,7 +1244,7 @@ async def set_table_cell_padding(filename: str, table_index: int, row_index: int
                                               left, right, word_unit)
         
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
             padding_desc = []
             if top is not None:
                 padding_desc.append(f"top={top}")
@@ -13,6 +13,7 @@ from docx import Document
 import msoffcrypto 
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension
+from word_document_server.utils.document_utils import save_document, close_document
 
 
 
@@ -41,6 +42,9 @@ async def protect_document(filename: str, password: str) -> str:
         return f"Cannot protect document: {error_message}"
 
     try:
+        # The file is rewritten as raw bytes below, so drop any cached copy
+        close_document(filename)
+
         # Read the original file content
         with open(filename, "rb") as infile:
             original_data = infile.read()
@@ -162,7 +166,7 @@ async def add_digital_signature(filename: str, signer_name: str, reason: Optiona
             signature_para.add_run(f"\nSignature ID: {signature_info['content_hash'][:8]}")
 
             # Save the document with the visible signature
-            doc.save(filename)
+            save_document(doc, filename)
 
             return f"Digital signature added to document {filename}"
         else:
@@ -240,6 +244,9 @@ async def unprotect_document(filename: str, password: str) -> str:
         return f"Cannot modify document: {error_message}"
 
     try:
+        # The file is rewritten as raw bytes below, so drop any cached copy
+        close_document(filename)
+
         # Read the encrypted file content
         with open(filename, "rb") as infile:
             encrypted_data = infile.read()
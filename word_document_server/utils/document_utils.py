@@ -2,7 +2,9 @@
 Document utility functions for Word Document Server.
 """
 import json
-from typing import Dict, List, Any
+import os
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple
 from docx import Document
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
@@ -230,7 +232,7 @@ def insert_header_near_text(doc_path: str, target_text: str = None, header_title
             para._element.addprevious(new_para._element)
         else:
             para._element.addnext(new_para._element)
-        doc.save(doc_path)
+        save_document(doc, doc_path)
         if anchor_index is not None:
             return f"Header '{header_title}' (style: {header_style}) inserted {position} paragraph (index {anchor_index})."
         else:
@@ -285,7 +287,7 @@ def insert_line_or_paragraph_near_text(doc_path: str, target_text: str = None, l
             para._element.addprevious(new_para._element)
         else:
             para._element.addnext(new_para._element)
-        doc.save(doc_path)
+        save_document(doc, doc_path)
         if anchor_index is not None:
             return f"Line/paragraph inserted {position} paragraph (index {anchor_index}) with style '{style}'."
         else:
@@ -360,7 +362,7 @@ def insert_numbered_list_near_text(doc_path: str, target_text: str = None, list_
                 para._element.addprevious(p._element)
             else:
                 para._element.addnext(p._element)
-        doc.save(doc_path)
+        save_document(doc, doc_path)
         if anchor_index is not None:
             return f"Numbered list inserted {position} paragraph (index {anchor_index})."
         else:
@@ -476,7 +478,7 @@ def replace_paragraph_block_below_header(
         current_para._element.addnext(new_para._element)
         current_para = new_para
     
-    doc.save(doc_path)
+    save_document(doc, doc_path)
     return f"Replaced content under '{header_text}' with {len(new_paragraphs)} paragraph(s), style: {style_to_use}, removed {removed_count} elements."
 
 
@@ -549,7 +551,7 @@ def replace_block_between_manual_anchors(
         to_remove.append(elements[i])
     for el in to_remove:
         body.remove(el)
-    doc.save(doc_path)
+    save_document(doc, doc_path)
     # Reload and find start anchor for insertion
     doc = Document(doc_path)
     paras = doc.paragraphs
@@ -566,5 +568,99 @@ def replace_block_between_manual_anchors(
         new_para = doc.add_paragraph(text, style=style_to_use)
         anchor_para._element.addnext(new_para._element)
         anchor_para = new_para
-    doc.save(doc_path)
+    save_document(doc, doc_path)
     return f"Replaced content between '{start_anchor_text}' and '{end_anchor_text or 'next logical header'}' with {len(new_paragraphs)} paragraph(s), style: {style_to_use}, removed {len(to_remove)} elements."
+
+
+# Open documents keyed by absolute path, holding (file signature, Document).
+# Ordered by last use so the least recently used entry is evicted first.
+DOCUMENT_CACHE_MAXSIZE = 8
+_doc_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], Any]]" = OrderedDict()
+
+
+def _file_signature(path: str) -> Tuple[int, int, int]:
+    """
+    Identify the current state of a file on disk.
+    
+    Size and inode are compared along with the modification time, so edits
+    and replacements made within the timestamp resolution of the filesystem
+    are still noticed.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        Tuple of (st_mtime_ns, st_size, st_ino)
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _cache_document(path: str, signature: Tuple[int, int, int], doc) -> None:
+    """Record a document in the cache, evicting the least recently used entries."""
+    _doc_cache[path] = (signature, doc)
+    _doc_cache.move_to_end(path)
+    while len(_doc_cache) > DOCUMENT_CACHE_MAXSIZE:
+        _doc_cache.popitem(last=False)
+
+
+def load_document(doc_path: str):
+    """
+    Load a Word document, reusing the cached copy if the file is unchanged on disk.
+    
+    Args:
+        doc_path: Path to the Word document
+        
+    Returns:
+        The Document object
+    """
+    path = os.path.abspath(doc_path)
+    signature = _file_signature(path)
+    
+    cached = _doc_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        _doc_cache.move_to_end(path)
+        return cached[1]
+    
+    doc = Document(path)
+    _cache_document(path, signature, doc)
+    return doc
+
+
+def save_document(doc, doc_path: str, keep_open: bool = False) -> None:
+    """
+    Save a Word document and update the cache to match.
+    
+    Any cached copy of the file is dropped unless keep_open is set, in which
+    case the saved document is cached under the new signature of its file.
+    
+    Args:
+        doc: The Document object to save
+        doc_path: Path to save the document to
+        keep_open: Keep the document cached for later load_document calls
+    """
+    path = os.path.abspath(doc_path)
+    try:
+        doc.save(path)
+    except Exception:
+        # The in-memory document no longer matches what is on disk
+        _doc_cache.pop(path, None)
+        raise
+    
+    if keep_open:
+        _cache_document(path, _file_signature(path), doc)
+    else:
+        _doc_cache.pop(path, None)
+
+
+def close_document(doc_path: str) -> bool:
+    """
+    Drop a Word document from the cache.
+    
+    Args:
+        doc_path: Path to the Word document
+        
+    Returns:
+        True if the document was cached, False otherwise
+    """
+    return _doc_cache.pop(os.path.abspath(doc_path), None) is not None